@@ -6,6 +6,9 @@ from typing import List, Tuple
 
 schema = dj.schema(dj.config.get('database.prefix') + 'churchland_common_acquisition') 
 
+# Blackrock NSx file extension pattern
+_NSX_EXT_RE = re.compile(r'ns\d$')
+
 # =======
 # LEVEL 0
 # =======
@@ -147,7 +150,7 @@ class EphysRecording(dj.Manual):
             # load file based on file extension
             ephys_file_extension = self.fetch1('ephys_file_extension')
              
-            if re.match('ns\d$', ephys_file_extension):
+            if _NSX_EXT_RE.match(ephys_file_extension):
 
                 reader = neo.rawio.BlackrockRawIO(ephys_file_path)
                 reader.parse_header()
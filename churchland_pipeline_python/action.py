@@ -64,15 +64,13 @@ class Mri(dj.Manual):
     ) -> None:
         """Inserts MRI entries and landmarks by reading data from a csv file."""
 
-        # add entry to master table
+        # master key
         master_key = dict(
             monkey=monkey,
             user_uni=user_uni,
             mri_date=mri_date,
         )
 
-        self.insert1(dict(**master_key, mri_notes=mri_notes))
-
         # load file as data frame
         landmark_df = pd.read_csv(file_path)
 
@@ -82,8 +80,13 @@ class Mri(dj.Manual):
         # append master key to landmark keys
         landmark_keys = [dict(**master_key,**k) for k in landmark_keys]
 
-        # insert to part table
-        self.Landmark.insert(landmark_keys)
+        with self().connection.transaction:
+
+            # insert to master table
+            self.insert1(dict(**master_key, mri_notes=mri_notes))
+
+            # insert to part table
+            self.Landmark.insert(landmark_keys)
 
 
 
@@ -310,6 +310,8 @@ class ElectrodeArrayModel(dj.Lookup):
                 shank_grid = np.array([])
 
             # build electrode array
+            shank_keys = []
+            elec_keys = []
             for shank_idx, (shank_coords, shank) \
                 in enumerate(zip(np.ndindex(shank_grid.shape), shank_grid.flatten())):
 
@@ -325,13 +327,12 @@ class ElectrodeArrayModel(dj.Lookup):
                     shank_tip_length = Decimal(shank['shank_tip_length']).quantize(Decimal('1e-9'))
                 )
 
-                self.Shank.insert1(shank_key)
+                shank_keys.append(shank_key)
                 
                 elec_geom_key = (ElectrodeGeometry & shank['electrode_geometry']).fetch1('KEY')
 
                 if 'electrode_grid_coords' in shank.keys():
 
-                    elec_keys = []
                     for elec_idx, elec_coords in enumerate(shank['electrode_grid_coords']):
                         
                         elec_keys.append(dict(
@@ -348,7 +349,6 @@ class ElectrodeArrayModel(dj.Lookup):
                     electrode_grid_x_center = (shank['electrode_grid_spacing'][0] * (shank['electrode_grid_shape'][0] - 1))/2
                     electrode_grid_x_center = Decimal(electrode_grid_x_center).quantize(Decimal('1e-9'))
 
-                    elec_keys = []
                     for elec_idx, elec_coords in enumerate(np.ndindex(shank['electrode_grid_shape'])):
 
                         # electrode x-y coordinates
@@ -365,6 +365,9 @@ class ElectrodeArrayModel(dj.Lookup):
                             **elec_geom_key
                         ))
 
+            # insert shanks and electrodes
+            with self.connection.transaction:
+                self.Shank.insert(shank_keys)
                 self.Electrode.insert(elec_keys)
         
 
@@ -502,16 +505,18 @@ class ElectrodeArrayConfig(dj.Lookup):
         # update electrode keys with channel information
         electrode_keys = [dict(chan_key, **elec_key) for chan_key, elec_key in zip(channel_keys, electrode_keys)]
 
-        # insert config key
-        self.insert1(dict(
-            **config_key,
-            user_uni=user_uni,
-            electrode_array_config_date=config_date,
-            electrode_array_config_notes=config_notes
-        ))
+        with self().connection.transaction:
 
-        # insert channel keys
-        self.Channel.insert(channel_keys)
+            # insert config key
+            self.insert1(dict(
+                **config_key,
+                user_uni=user_uni,
+                electrode_array_config_date=config_date,
+                electrode_array_config_notes=config_notes
+            ))
 
-        # insert electrode keys
-        self.Electrode.insert(electrode_keys)
\ No newline at end of file
+            # insert channel keys
+            self.Channel.insert(channel_keys)
+
+            # insert electrode keys
+            self.Electrode.insert(electrode_keys)
\ No newline at end of file
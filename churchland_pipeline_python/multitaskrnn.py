@@ -1,4 +1,6 @@
 import datajoint as dj
+import numpy as np
+from typing import List
 schema = dj.schema(dj.config.get('database.prefix') +'multitask_network')
 
 @schema
@@ -8,8 +10,53 @@ class ReachingDataMark(dj.Manual):
     condition: tinyint unsigned
     delay_short: smallint unsigned
     muscle_label: tinyint unsigned
-    ----- 
-    muscle: longblob
-    goenvelope: longblob
-    times: longblob
-    '''
\ No newline at end of file
+    -----
+    muscle: longblob     # muscle activity (float32)
+    goenvelope: longblob # go cue envelope (float32)
+    times: longblob      # time vector (float32)
+    '''
+
+    @classmethod
+    def ezinsert(
+        self,
+        monkey: str,
+        condition: int,
+        delay_short: int,
+        times: np.ndarray,
+        muscle: np.ndarray,
+        goenvelope: np.ndarray,
+        muscle_labels: List[int]=None
+    ) -> None:
+        """Easy insert condition data.
+
+        Args:
+            monkey (str): Monkey name
+            condition (int): Condition number
+            delay_short (int): Short delay
+            times (np.ndarray): Time vector (T,)
+            muscle (np.ndarray): Muscle activity (N muscles x T)
+            goenvelope (np.ndarray): Go cue envelope, either per muscle (N muscles x T) or shared (T,)
+            muscle_labels (List[int], optional): Muscle labels. If None, uses the row index of each muscle.
+        """
+
+        # cast arrays to single precision
+        times = np.asarray(times, dtype=np.float32)
+        muscle = np.atleast_2d(np.asarray(muscle, dtype=np.float32))
+        goenvelope = np.broadcast_to(np.asarray(goenvelope, dtype=np.float32), muscle.shape)
+
+        if muscle_labels is None:
+            muscle_labels = range(muscle.shape[0])
+
+        assert len(muscle_labels) == muscle.shape[0], 'Specify one label per muscle'
+        assert times.shape[-1] == muscle.shape[-1], 'Time vector and muscle data lengths differ'
+
+        condition_key = dict(monkey=monkey, condition=condition, delay_short=delay_short)
+
+        # make muscle keys
+        muscle_keys = [
+            dict(condition_key, muscle_label=label, muscle=muscle_data, goenvelope=np.ascontiguousarray(goenvelope_data), times=times)
+            for label, muscle_data, goenvelope_data in zip(muscle_labels, muscle, goenvelope)
+        ]
+
+        # insert muscle keys
+        self.insert(muscle_keys)
@@ -75,8 +75,8 @@ class EphysSync(dj.Imported):
         sync_idx = (acquisition.EphysRecording.Channel & key & {'ephys_channel_type': 'sync'}).fetch1('ephys_channel_idx')
 
         # fetch local ephys recording file path and sample rate
-        fs_ephys = (acquisition.EphysRecording & key).fetch1('ephys_recording_sample_rate')
-        ephys_file_path = (acquisition.EphysRecording.File & key).proj_file_path().fetch1('ephys_file_path')
+        fs_ephys, ephys_file_path = ((acquisition.EphysRecording.File & key).proj_file_path() * acquisition.EphysRecording)\
+            .fetch1('ephys_recording_sample_rate', 'ephys_file_path')
 
         # ensure local path
         ephys_file_path = reference.EngramTier.ensure_local(ephys_file_path)
@@ -412,40 +412,39 @@ class MotorUnit(dj.Imported):
 
     def make(self, key):
 
-        # get path to sort files
-        emg_sort = EmgSort & key
-        emg_sort_path = emg_sort.fetch1('emg_sort_path')
+        # get path to sort files and spike sorter
+        emg_sort_path, sort_software = (EmgSort & key).fetch1('emg_sort_path', 'software')
 
         # ensure local path
         emg_sort_path = reference.EngramTier.ensure_local(emg_sort_path)
 
         # load sort data
-        if emg_sort & {'software': 'Myosort'}:
+        if sort_software == 'Myosort':
 
             if 'matlab_export' in emg_sort_path:
 
                 # read data (and convert channels to 0-indexing)
-                spikes = sio.loadmat(emg_sort_path + 'spikes.mat')['spikes'].flatten()
-                labels = sio.loadmat(emg_sort_path + 'labels.mat')['labels'].flatten()
-                channels = sio.loadmat(emg_sort_path + 'channels.mat')['channels'].flatten() - 1
-                templates = sio.loadmat(emg_sort_path + 'templates.mat')['templates']
+                spikes = sio.loadmat(os.path.join(emg_sort_path, 'spikes.mat'))['spikes'].flatten()
+                labels = sio.loadmat(os.path.join(emg_sort_path, 'labels.mat'))['labels'].flatten()
+                channels = sio.loadmat(os.path.join(emg_sort_path, 'channels.mat'))['channels'].flatten() - 1
+                templates = sio.loadmat(os.path.join(emg_sort_path, 'templates.mat'))['templates']
 
                 # label group
                 label_group = np.unique(labels)
 
             else:
                 # import last saved spike field
-                spikes = sio.loadmat(emg_sort_path + 'spikes.mat')['Spk'][0][0][-1]
+                spikes = sio.loadmat(os.path.join(emg_sort_path, 'spikes.mat'))['Spk'][0][0][-1]
 
                 # import labels and templates
-                labels = sio.loadmat(emg_sort_path + 'labels.mat')['Lab'][0][0]
-                templates = sio.loadmat(emg_sort_path + 'templates.mat')['W'][0][0]
+                labels = sio.loadmat(os.path.join(emg_sort_path, 'labels.mat'))['Lab'][0][0]
+                templates = sio.loadmat(os.path.join(emg_sort_path, 'templates.mat'))['W'][0][0]
 
                 # infer import field based on last entry with non-zero templates
                 import_idx = next(i for i in reversed(range(len(templates))) if templates[i].shape[0] > 0)
                 import_field = templates.dtype.names[import_idx]
 
-                labels = labels[next(i for i,name in enumerate(labels.dtype.names) if name==import_field)]
+                labels = labels[labels.dtype.names.index(import_field)]
                 templates = templates[import_idx]
 
                 # label groups
@@ -455,7 +454,7 @@ class MotorUnit(dj.Imported):
                 templates = None
 
         else:
-            print('Spike sorter {} unrecognized. Unspecified import method.'.format(emg_sort.fetch1('software')))
+            print('Spike sorter {} unrecognized. Unspecified import method.'.format(sort_software))
             return None
 
         # construct motor unit keys
@@ -470,13 +469,18 @@ class MotorUnit(dj.Imported):
         # construct template keys
         if np.any(templates):
 
+            # map EMG channel indices to channel keys
+            channel_keys, channel_indices = (acquisition.EmgChannelGroup.Channel & key).fetch('KEY', 'emg_channel_idx')
+            assert len(set(channel_indices)) == len(channel_indices), 'EMG channel indices are not unique'
+            channel_keys = dict(zip(channel_indices, channel_keys))
+
             template_keys = []
             for chan_idx, unit_idx in itertools.product(range(templates.shape[0]), range(templates.shape[2])):
 
                 template_keys.append({
                     **key, 
                     'motor_unit_id': unit_idx, 
-                    **(acquisition.EmgChannelGroup.Channel & key & {'emg_channel_idx': channels[chan_idx]}).fetch1('KEY'),
+                    **channel_keys[channels[chan_idx]],
                     'motor_unit_template': templates[chan_idx, :, unit_idx]
                 })
 
@@ -518,15 +522,18 @@ class Neuron(dj.Imported):
             n_columns = len(unique_electrode_x)
             n_rows = np.array(unique_electrode_x.fetch('count')).max()
 
+            # electrode coordinates
+            electrode_x, electrode_y = array_electrodes.fetch('electrode_x', 'electrode_y')
+
             # origin coordinate
-            origin = np.vstack((array_electrodes).fetch('electrode_x', 'electrode_y')).min(axis=1)
+            origin = np.vstack((electrode_x, electrode_y)).min(axis=1)
 
             # x and y scales
-            x_scale = (np.diff(sorted(unique_electrode_x.fetch('electrode_x'))).min() if n_columns > 1 else 1)
+            x_scale = (np.diff(np.unique(electrode_x)).min() if n_columns > 1 else 1)
 
             min_dy_per_column = np.array([
-                np.diff(sorted((array_electrodes & elec_x).fetch('electrode_y'))).min() 
-                for elec_x in unique_electrode_x.fetch('KEY')
+                np.diff(sorted(electrode_y[electrode_x == elec_x])).min() 
+                for elec_x in np.unique(electrode_x)
             ])
             y_scale = (min_dy_per_column.min() if n_rows > 1 else 1)
 
@@ -564,19 +571,18 @@ class Neuron(dj.Imported):
 
     def make(self, key):
 
-        # get path to sort files
-        brain_sort = BrainSort & key
-        brain_sort_path = brain_sort.fetch1('brain_sort_path')
+        # get path to sort files and spike sorter
+        brain_sort_path, sort_software = (BrainSort & key).fetch1('brain_sort_path', 'software')
 
         # ensure local path
         brain_sort_path = reference.EngramTier.ensure_local(brain_sort_path)
 
         # load sort data
-        if brain_sort & {'software': 'Kilosort'}:
+        if sort_software == 'Kilosort':
             
-            t_spike = np.load(brain_sort_path + 'spike_times.npy').astype(int)
-            cluster_id = np.load(brain_sort_path + 'spike_clusters.npy')
-            cluster_group = pd.read_csv(brain_sort_path + 'cluster_group.tsv', delimiter='\t')
+            t_spike = np.load(os.path.join(brain_sort_path, 'spike_times.npy')).astype(int)
+            cluster_id = np.load(os.path.join(brain_sort_path, 'spike_clusters.npy'))
+            cluster_group = pd.read_csv(os.path.join(brain_sort_path, 'cluster_group.tsv'), delimiter='\t')
 
             # rename cluster groups
             cluster_group['group'].replace({'good': 'single', 'mua': 'multi'}, inplace=True)
@@ -585,7 +591,7 @@ class Neuron(dj.Imported):
             cluster_group = cluster_group[cluster_group['group'].isin(['single', 'multi'])]
 
         else:
-            print('Spike sorter {} unrecognized. Unspecified import method.'.format(brain_sort.fetch1('software')))
+            print('Spike sorter {} unrecognized. Unspecified import method.'.format(sort_software))
             return None
 
         # construct neuron keys
@@ -1,5 +1,6 @@
 import datajoint as dj
 import os, sys
+from functools import lru_cache
 
 schema = dj.schema(dj.config.get('database.prefix') + 'churchland_common_reference')
 
@@ -68,10 +69,10 @@ class EngramTier(dj.Lookup):
         """Ensures that a path to a storage tier is provided relative to the remote (U19) server."""
 
         # infer storage tier from file path
-        engram_tier = {'engram_tier': tier for tier in self.fetch('engram_tier') if tier in path}
+        local_path, remote_path = _match_engram_tier_paths(path)
 
         # convert local path parts to remote
-        path = path.replace((self & engram_tier).get_local_path(), (self & engram_tier).get_remote_path())
+        path = path.replace(local_path, remote_path)
 
         return path
 
@@ -80,14 +81,36 @@ class EngramTier(dj.Lookup):
         """Ensures that a path to a storage tier is provided relative to the local filesystem."""
 
         # infer storage tier from file path
-        engram_tier = {'engram_tier': tier for tier in self.fetch('engram_tier') if tier in path}
+        local_path, remote_path = _match_engram_tier_paths(path)
 
         # convert remote path parts to local
-        path = path.replace((self & engram_tier).get_remote_path(), (self & engram_tier).get_local_path())
+        path = path.replace(remote_path, local_path)
 
         return path
 
 
+@lru_cache(maxsize=None)
+def _engram_tier_paths() -> dict:
+    """Maps each storage tier to its (local, remote) path pair.
+
+    Cached for the lifetime of the process. Call _engram_tier_paths.cache_clear() if EngramTier contents change."""
+
+    return {
+        tier: ((EngramTier & {'engram_tier': tier}).get_local_path(), (EngramTier & {'engram_tier': tier}).get_remote_path())
+        for tier in EngramTier.fetch('engram_tier')
+    }
+
+
+def _match_engram_tier_paths(path: str) -> tuple:
+    """Returns the (local, remote) path pair of the storage tier named in a path."""
+
+    tier_paths = [paths for tier, paths in _engram_tier_paths().items() if tier in path]
+
+    assert tier_paths, 'Path {} does not point to a storage tier'.format(path)
+
+    return tier_paths[-1]
+
+
 # ==========
 # PHYSIOLOGY
 # ==========
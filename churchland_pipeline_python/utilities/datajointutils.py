@@ -187,12 +187,15 @@ def insert_part(master: DataJointTable, part_name: str, **kwargs) -> None:
             # cross reference
             assert not any([kwargs == entity_attr for entity_attr in part_entity_attr]), 'Duplicate entry!'
 
-        # insert ID to master table
         master_key = {master_attr_name: next_unique_int(master, master_attr_name)}
-        master.insert1(master_key)
 
-        # insert entry to part table
-        part.insert1(dict(**master_key, **kwargs))
+        with master().connection.transaction:
+
+            # insert ID to master table
+            master.insert1(master_key)
+
+            # insert entry to part table
+            part.insert1(dict(**master_key, **kwargs))
 
     except AttributeError:
         print('Unrecognized part name: {}'.format(part_name))
@@ -231,7 +234,7 @@ def next_unique_int(table: DataJointTable, attr: str, key: dict={}) -> int:
     if not(table & key):
         min_val = 0
     else:
-        all_val = table.fetch(attr)
+        all_val = set(table.fetch(attr))
         min_val = next(i for i in range(2+max(all_val)) if i not in all_val)
 
     return min_val